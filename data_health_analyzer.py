@@ -7,19 +7,97 @@ summary of the dataset health.
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import gzip
+import hashlib
 import io
+import json
 import os
+import sys
+import zlib
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 
+from cachetools import TTLCache
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+try:
+    from openai import AsyncOpenAI
+    from openai.types import CompletionUsage
+except ImportError:  # The OpenAI integration is optional.
+    AsyncOpenAI = None
+    CompletionUsage = None
+
 
 EXPECTED_COLUMNS = ["user_id", "sessions", "clicks", "errors"]
-NUMERIC_COLUMNS = ["sessions", "clicks", "errors"]
+SAMPLE_ROW_COUNT = 5
+CSV_CONTENT_TYPES = {"text/csv", "application/vnd.ms-excel"}
+GZIP_CONTENT_TYPES = {"application/gzip", "application/x-gzip"}
+# Upper bounds on warnings returned to clients and included in the OpenAI prompt,
+# so a dataset full of invalid rows cannot produce an unbounded response.
+MAX_WARNINGS = 500
+PROMPT_WARNING_LIMIT = 50
+# int() rejects digit strings longer than the interpreter's conversion limit
+# (0 disables the limit; Python before 3.10.7 has none); longer cells are
+# reported as invalid integers.
+MAX_INTEGER_DIGITS = getattr(sys, "get_int_max_str_digits", lambda: 0)() or sys.maxsize
+
+# Validation findings are recorded as (row_number, code, column, value) tuples
+# and only rendered into user-facing text once validation has finished.
+ValidationIssue = Tuple[int, str, str, str]
+WARNING_TEMPLATES: Dict[str, str] = {
+    "duplicate_user_id": "Row {row}: duplicate user_id {value} detected.",
+    "missing_value": "Row {row}: missing value in {column} column.",
+    "invalid_integer": "Row {row}: invalid integer value '{value}' in {column} column.",
+    "negative_value": "Row {row}: negative value in {column} column.",
+}
+
+# Static instructions sent as the system message. Keeping them identical across
+# requests, ahead of any dataset-specific text, lets OpenAI's automatic prompt
+# caching reuse the shared prefix.
+SYSTEM_PROMPT = (
+    "You are a helpful technical support co-pilot assisting a Technical Support "
+    "Engineer who is reviewing a CSV upload of user activity metrics.\n\n"
+    "The dataset has the columns user_id, sessions, clicks, and errors. user_id is "
+    "a string identifier; sessions, clicks, and errors are non-negative integers. "
+    "Validation warnings report missing values, invalid or negative numbers, and "
+    "duplicate user_id values, with row numbers counting the header as row 1.\n\n"
+    "Each user message contains a DATA SUMMARY, the VALIDATION WARNINGS, and a few "
+    "SAMPLE ROWS. Using that information, write a brief support ticket update that:\n"
+    "1. Summarizes the health of the dataset.\n"
+    "2. Suggests 2-3 likely causes for inconsistent uploads.\n"
+    "3. Recommends one immediate remediation step.\n"
+    "Keep the tone clear, professional, and action-oriented. Do not include code."
+)
+
+SummaryResult = Tuple[Optional[str], Optional[str]]
+
+# Concurrent /analyze requests are coalesced into one OpenAI call when they
+# arrive within this window, up to the given batch size.
+SUMMARY_BATCH_WINDOW_SECONDS = 0.25
+SUMMARY_BATCH_MAX_SIZE = 8
+SUMMARY_MAX_TOKENS = 400
+
+BATCH_SYSTEM_PROMPT = (
+    f"{SYSTEM_PROMPT}\n\n"
+    "The user message may contain several numbered tickets, each with its own "
+    "dataset. Write a separate update for every ticket and respond with a JSON "
+    'object that maps each ticket number, as a string, to its update text, e.g. '
+    '{"1": "...", "2": "..."}.'
+)
+
+# A recent summary is reused when an upload produces exactly the same prompt
+# (for example, the same export uploaded again). Keying on the full prompt keeps
+# one upload's user ids and row numbers from appearing in another's summary.
+SUMMARY_CACHE_TTL_SECONDS = 60 * 60
+SUMMARY_CACHE_MAX_SIZE = 1024
+CACHED_SUMMARY_NOTICE = "AI summary reused from a recent analysis of identical data."
+summary_cache: TTLCache = TTLCache(maxsize=SUMMARY_CACHE_MAX_SIZE, ttl=SUMMARY_CACHE_TTL_SECONDS)
 
 
 class SummaryStatistics(BaseModel):
@@ -39,109 +117,160 @@ class AnalysisResponse(BaseModel):
     ai_notice: Optional[str]
 
 
-def parse_csv_rows(csv_text: str) -> List[Dict[str, str]]:
-    """Create a row dictionary for each CSV record.
+def _iter_records(reader: Iterator[List[str]], width: int) -> Iterator[List[str]]:
+    """Yield non-blank records padded to ``width`` so cells can be indexed directly."""
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        yield row
+
+
+def parse_csv_rows(csv_stream: TextIO) -> Tuple[List[str], Iterator[List[str]]]:
+    """Read the header and prepare a lazy iterator over the data records.
+
+    Records are yielded as plain lists rather than per-row dictionaries so the
+    validator can index cells positionally using offsets resolved from the
+    header. Only the first record is read up front; the rest are parsed as the
+    iterator is consumed, so memory use does not grow with the file size.
 
     Args:
-        csv_text: Raw CSV file contents as text.
+        csv_stream: Text stream positioned at the start of the CSV data, opened
+            with ``newline=""`` as the ``csv`` module expects.
 
     Raises:
         ValueError: if headers are missing, required columns are absent, or there
             are no data rows.
     """
-    csv_stream = io.StringIO(csv_text)
-    reader = csv.DictReader(csv_stream)
+    reader = csv.reader(csv_stream)
 
-    if reader.fieldnames is None:
+    header = next(reader, None)
+    if header is None:
         raise ValueError("The input file is missing a header row.")
 
-    missing_columns = [col for col in EXPECTED_COLUMNS if col not in reader.fieldnames]
+    missing_columns = [col for col in EXPECTED_COLUMNS if col not in header]
     if missing_columns:
         raise ValueError(f"Missing required columns: {', '.join(missing_columns)}.")
 
-    rows = list(reader)
-    if not rows:
+    rows = _iter_records(reader, len(header))
+    first_row = next(rows, None)
+    if first_row is None:
         raise ValueError("The input file is empty. Please upload a valid dataset.")
 
-    return rows
+    return header, chain([first_row], rows)
+
+
+def classify_count(raw_value: str) -> Optional[str]:
+    """Return the issue code for a stripped count cell, or None if it is valid.
+
+    Valid cells are digit strings that ``int()`` accepts, including signed
+    zeros such as ``-0``. They are classified with ``str.isdecimal()`` and a
+    length check against ``MAX_INTEGER_DIGITS``, so invalid cells never raise.
+    """
+    if raw_value.isdecimal():
+        return None if len(raw_value) <= MAX_INTEGER_DIGITS else "invalid_integer"
+    if raw_value == "":
+        return "missing_value"
+    digits = raw_value[1:]
+    if raw_value[0] == "-" and digits.isdecimal() and len(digits) <= MAX_INTEGER_DIGITS:
+        return "negative_value" if digits.strip("0") else None
+    return "invalid_integer"
 
 
 def validate_rows(
-    rows: List[Dict[str, str]]
-) -> Tuple[List[str], Dict[str, List[int]], Dict[str, bool], List[str]]:
-    """Validate each CSV row and gather metrics for later aggregation.
+    header: List[str],
+    rows: Iterable[List[str]],
+) -> Tuple[List[ValidationIssue], int, Dict[str, int], Dict[str, bool], Dict[str, None]]:
+    """Validate each CSV row and fold its metrics into per-user totals.
 
     Row numbering follows the CSV line numbers (header is row 1), meaning the
-    first data row is reported to users as row 2.
+    first data row is reported to users as row 2. Findings are returned as
+    ``ValidationIssue`` tuples; use ``format_warnings`` to render them. At most
+    ``MAX_WARNINGS`` issues are kept, alongside a count of those suppressed.
     """
-    warnings: List[str] = []
-    seen_user_ids: set[str] = set()
-    sessions_per_user: Dict[str, List[int]] = defaultdict(list)
+    user_id_index = header.index("user_id")
+    sessions_index = header.index("sessions")
+    clicks_index = header.index("clicks")
+    errors_index = header.index("errors")
+
+    issues: List[ValidationIssue] = []
+    # Bound once so the hot loop skips the attribute lookup per issue.
+    append_issue = issues.append
+    suppressed_count = 0
+    sessions_per_user: Dict[str, int] = defaultdict(int)
     errors_flag_by_user: Dict[str, bool] = defaultdict(bool)
-    unique_user_ids: List[str] = []
+    # Insertion-ordered dict doubles as the membership check for duplicates.
+    unique_user_ids: Dict[str, None] = {}
 
     for row_number, row in enumerate(rows, start=2):
-        user_id = (row.get("user_id") or "").strip()
+        user_id = row[user_id_index].strip()
 
         if user_id:
-            if user_id not in seen_user_ids:
-                unique_user_ids.append(user_id)
-                seen_user_ids.add(user_id)
+            if user_id in unique_user_ids:
+                append_issue((row_number, "duplicate_user_id", "user_id", user_id))
             else:
-                warnings.append(f"Row {row_number}: duplicate user_id {user_id} detected.")
+                unique_user_ids[user_id] = None
         else:
-            warnings.append(f"Row {row_number}: missing value in user_id column.")
-
-        for column in NUMERIC_COLUMNS:
-            raw_value = (row.get(column) or "").strip()
-
-            if raw_value == "":
-                warnings.append(f"Row {row_number}: missing value in {column} column.")
-                continue
-
-            try:
-                numeric_value = int(raw_value)
-            except ValueError:
-                warnings.append(
-                    f"Row {row_number}: invalid integer value '{raw_value}' in {column} column."
-                )
-                continue
-
-            if numeric_value < 0:
-                warnings.append(f"Row {row_number}: negative value in {column} column.")
-                continue
-
-            if column == "sessions" and user_id:
-                sessions_per_user[user_id].append(numeric_value)
-            if column == "errors" and user_id and numeric_value > 0:
-                errors_flag_by_user[user_id] = True
-
-    return warnings, sessions_per_user, errors_flag_by_user, unique_user_ids
+            append_issue((row_number, "missing_value", "user_id", ""))
+
+        # The numeric columns are fixed, so they are checked inline rather than
+        # in a loop; each block also applies that column's own aggregation.
+        raw_value = row[sessions_index].strip()
+        issue_code = classify_count(raw_value)
+        if issue_code:
+            append_issue((row_number, issue_code, "sessions", raw_value))
+        elif user_id:
+            # Signed zeros add 0 but still register the user for the average.
+            sessions_per_user[user_id] += int(raw_value)
+
+        raw_value = row[clicks_index].strip()
+        issue_code = classify_count(raw_value)
+        if issue_code:
+            append_issue((row_number, issue_code, "clicks", raw_value))
+
+        raw_value = row[errors_index].strip()
+        issue_code = classify_count(raw_value)
+        if issue_code:
+            append_issue((row_number, issue_code, "errors", raw_value))
+        elif user_id and int(raw_value) > 0:
+            errors_flag_by_user[user_id] = True
+
+        # Checked once per row rather than per issue; a row adds at most four.
+        if len(issues) > MAX_WARNINGS:
+            suppressed_count += len(issues) - MAX_WARNINGS
+            del issues[MAX_WARNINGS:]
+
+    return issues, suppressed_count, sessions_per_user, errors_flag_by_user, unique_user_ids
+
+
+def format_warnings(issues: Iterable[ValidationIssue], suppressed_count: int = 0) -> List[str]:
+    """Render validation issues into user-facing warning messages."""
+    warnings = [
+        WARNING_TEMPLATES[code].format(row=row_number, column=column, value=value)
+        for row_number, code, column, value in issues
+    ]
+    if suppressed_count:
+        warnings.append(f"... and {suppressed_count} additional warnings suppressed.")
+    return warnings
 
 
 def compute_summary_statistics(
-    unique_user_ids: List[str],
-    sessions_per_user: Dict[str, List[int]],
+    unique_user_ids: Collection[str],
+    sessions_per_user: Dict[str, int],
     errors_flag_by_user: Dict[str, bool],
 ) -> SummaryStatistics:
     """Summarize validated data with key metrics."""
     unique_user_count = len(unique_user_ids)
 
-    aggregated_sessions = {
-        user_id: sum(values)
-        for user_id, values in sessions_per_user.items()
-        if values
-    }
-    if aggregated_sessions:
-        avg_sessions = sum(aggregated_sessions.values()) / len(aggregated_sessions)
+    if sessions_per_user:
+        avg_sessions = sum(sessions_per_user.values()) / len(sessions_per_user)
     else:
         avg_sessions = 0.0
 
-    users_with_errors = {
-        user_id for user_id, has_errors in errors_flag_by_user.items() if has_errors
-    }
+    users_with_errors_count = sum(errors_flag_by_user.values())
     error_percentage = (
-        (len(users_with_errors) / unique_user_count) * 100 if unique_user_count else 0.0
+        (users_with_errors_count / unique_user_count) * 100 if unique_user_count else 0.0
     )
 
     return SummaryStatistics(
@@ -153,42 +282,227 @@ def compute_summary_statistics(
 
 def build_openai_prompt(
     warnings: List[str],
+    total_warnings: int,
     stats: SummaryStatistics,
     sample_rows: List[Dict[str, str]],
 ) -> str:
-    """Assemble a concise prompt describing the dataset health."""
-    warning_text = "None" if not warnings else "\n".join(f"- {item}" for item in warnings)
+    """Assemble the dataset-specific user message that follows ``SYSTEM_PROMPT``.
+
+    ``total_warnings`` is the number of issues found, including any that were
+    suppressed from ``warnings``, so the prompt states the real total.
+    """
+    # Slicing to the real issue count also drops the trailing suppression note.
+    listed_warnings = warnings[: min(PROMPT_WARNING_LIMIT, total_warnings)]
+    omitted_count = total_warnings - len(listed_warnings)
+    if omitted_count:
+        listed_warnings.append(f"... and {omitted_count} more warnings not listed.")
+    warning_text = (
+        "None" if not listed_warnings else "\n".join(f"- {item}" for item in listed_warnings)
+    )
     prompt = (
-        "You are assisting a Technical Support Engineer reviewing a CSV upload.\n\n"
         "DATA SUMMARY:\n"
         f"- Total Users: {stats.total_users}\n"
         f"- Average Sessions per User: {stats.average_sessions_per_user:.2f}\n"
         f"- Percent Users with Errors: {stats.percent_users_with_errors:.2f}%\n\n"
-        "VALIDATION WARNINGS:\n"
+        f"VALIDATION WARNINGS ({total_warnings} total):\n"
         f"{warning_text}\n\n"
         "SAMPLE ROWS:\n"
     )
 
-    for row in sample_rows[:5]:
+    for row in sample_rows[:SAMPLE_ROW_COUNT]:
         prompt += f"- {row}\n"
 
-    prompt += (
-        "\nWrite a brief support ticket update that:\n"
-        "1. Summarizes the health of the dataset.\n"
-        "2. Suggests 2-3 likely causes for inconsistent uploads.\n"
-        "3. Recommends one immediate remediation step.\n"
-        "Keep the tone clear, professional, and action-oriented. Do not include code."
-    )
     return prompt
 
 
-def generate_openai_summary(
+@lru_cache(maxsize=1)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Return a shared OpenAI client so its connection pool survives across requests.
+
+    The cache is keyed on the API key, so rotating ``OPENAI_API_KEY`` builds a
+    fresh client on the next call.
+    """
+    return AsyncOpenAI(api_key=api_key)
+
+
+def log_token_usage(usage: CompletionUsage) -> None:
+    """Print token accounting for an OpenAI completion."""
+    print(f"prompt tokens: {usage.prompt_tokens}")
+    print(f"completion tokens: {usage.completion_tokens}")
+    print(f"total tokens: {usage.total_tokens}")
+    prompt_details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(prompt_details, "cached_tokens", None) or 0
+    print(f"cached prompt tokens: {cached_tokens}")
+
+
+async def request_openai_summaries(
+    client: AsyncOpenAI,
+    prompts: List[str],
+) -> List[SummaryResult]:
+    """Request support summaries for one or more prompts in a single API call.
+
+    A single prompt is sent as-is. Several prompts are combined into a numbered
+    multi-ticket message and the model is asked for a JSON object keyed by
+    ticket number, which is split back into one result per prompt. If the
+    batched reply is empty, truncated, or not a JSON object, each prompt is
+    retried in its own call so one long ticket cannot fail the whole batch.
+    """
+    if len(prompts) == 1:
+        system_prompt = SYSTEM_PROMPT
+        user_content = prompts[0]
+        extra_options = {}
+    else:
+        system_prompt = BATCH_SYSTEM_PROMPT
+        user_content = "\n\n".join(
+            f"Ticket {number}:\n{prompt}" for number, prompt in enumerate(prompts, start=1)
+        )
+        extra_options = {"response_format": {"type": "json_object"}}
+
+    try:
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=0.3,
+            max_tokens=SUMMARY_MAX_TOKENS * len(prompts),
+            **extra_options,
+        )
+    except Exception as error:  # pragma: no cover - surface API issues
+        return [(None, f"OpenAI API call failed: {error}")] * len(prompts)
+
+    if len(prompts) == 1:
+        if not response.choices:
+            return [(None, "OpenAI API returned no completion choices.")]
+
+        message = response.choices[0].message
+        content = getattr(message, "content", None)
+        if not content:
+            return [(None, "OpenAI API completion contained no message content.")]
+
+        log_token_usage(response.usage)
+        return [(content.strip(), None)]
+
+    choice = response.choices[0] if response.choices else None
+    content = getattr(choice.message, "content", None) if choice else None
+    if content:
+        log_token_usage(response.usage)
+    # A reply cut off at max_tokens is incomplete JSON, so retry individually.
+    if not content or choice.finish_reason == "length":
+        return await request_summaries_individually(client, prompts)
+
+    try:
+        summaries = json.loads(content)
+    except json.JSONDecodeError:
+        return await request_summaries_individually(client, prompts)
+    if not isinstance(summaries, dict):
+        return await request_summaries_individually(client, prompts)
+
+    results: List[SummaryResult] = []
+    for number in range(1, len(prompts) + 1):
+        summary = summaries.get(str(number))
+        if isinstance(summary, str) and summary.strip():
+            results.append((summary.strip(), None))
+        else:
+            results.append((None, "OpenAI API batched completion omitted this ticket."))
+    return results
+
+
+async def request_summaries_individually(
+    client: AsyncOpenAI,
+    prompts: List[str],
+) -> List[SummaryResult]:
+    """Request one summary per prompt, issuing the calls concurrently."""
+    results = await asyncio.gather(
+        *(request_openai_summaries(client, [prompt]) for prompt in prompts)
+    )
+    return [result for (result,) in results]
+
+
+class SummaryBatcher:
+    """Buffer summary prompts briefly so bursts share a single OpenAI call.
+
+    The background worker is started lazily on the running event loop by the
+    first ``submit`` call and restarted if that loop has gone away.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = SUMMARY_BATCH_WINDOW_SECONDS,
+        max_size: int = SUMMARY_BATCH_MAX_SIZE,
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def submit(self, client: AsyncOpenAI, prompt: str) -> SummaryResult:
+        """Queue a prompt and wait for its summary."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((client, prompt, future))
+        return await future
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window_seconds
+            while len(batch) < self.max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without waiting so the next window starts collecting
+            # while this batch's completion is in flight.
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[AsyncOpenAI, str, asyncio.Future]]) -> None:
+        # Clients are cached per API key, so every item in a batch shares one.
+        client = batch[0][0]
+        try:
+            results = await request_openai_summaries(client, [prompt for _, prompt, _ in batch])
+        except Exception as error:  # pragma: no cover - never leave a caller waiting
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+summary_batcher = SummaryBatcher()
+
+
+def summary_cache_key(prompt: str) -> str:
+    """Hash a summary prompt for use as a ``summary_cache`` key."""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+
+async def generate_openai_summary(
     warnings: List[str],
+    total_warnings: int,
     stats: SummaryStatistics,
-    rows: List[Dict[str, str]],
-) -> Tuple[Optional[str], Optional[str]]:
+    sample_rows: List[Dict[str, str]],
+) -> SummaryResult:
     """Attempt to request an OpenAI-generated support summary.
 
+    A summary cached for an identical prompt is returned without calling the
+    API, with ``ai_notice`` saying it was reused.
+
     Returns:
         ai_summary: The generated summary text, if available.
         ai_notice: A user-facing message describing why the summary is missing.
@@ -197,52 +511,62 @@ def generate_openai_summary(
     if not api_key:
         return None, "OpenAI analysis skipped: OPENAI_API_KEY environment variable is not set."
 
-    try:
-        from openai import OpenAI
-    except ImportError:
+    if AsyncOpenAI is None:
         return None, "OpenAI analysis skipped: install the 'openai' package to enable this feature."
 
-    client = OpenAI(api_key=api_key)
-    prompt = build_openai_prompt(warnings, stats, rows)
+    client = get_openai_client(api_key)
+    prompt = build_openai_prompt(warnings, total_warnings, stats, sample_rows)
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful technical support co-pilot.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
-            max_tokens=400,
-        )
-    except Exception as error:  # pragma: no cover - surface API issues
-        return None, f"OpenAI API call failed: {error}"
+    cache_key = summary_cache_key(prompt)
+    cached_summary = summary_cache.get(cache_key)
+    if cached_summary is not None:
+        return cached_summary, CACHED_SUMMARY_NOTICE
 
-    if not response.choices:
-        return None, "OpenAI API returned no completion choices."
+    ai_summary, ai_notice = await summary_batcher.submit(client, prompt)
+    if ai_summary:
+        summary_cache[cache_key] = ai_summary
+    return ai_summary, ai_notice
 
-    message = response.choices[0].message
-    content = getattr(message, "content", None)
-    if not content:
-        return None, "OpenAI API completion contained no message content."
 
-    usage = response.usage
-    print(f"prompt tokens: {usage.prompt_tokens}")
-    print(f"completion tokens: {usage.completion_tokens}")
-    print(f"total tokens: {usage.total_tokens}")
-    
-    return content.strip(), None
+def inspect_csv_content(
+    csv_stream: TextIO,
+) -> Tuple[List[str], int, SummaryStatistics, List[Dict[str, str]]]:
+    """Parse and validate CSV data, returning everything the summary step needs.
+
+    Returns:
+        warnings: Formatted validation warnings.
+        total_warnings: Number of issues found, including suppressed ones.
+        stats: Summary statistics for the dataset.
+        sample_rows: The first few records, keyed by column name.
+    """
+    header, rows = parse_csv_rows(csv_stream)
+    # Keep only the sample records around for the prompt; everything else is
+    # validated and discarded as it streams past.
+    head = list(islice(rows, SAMPLE_ROW_COUNT))
+    (
+        issues,
+        suppressed_count,
+        sessions_per_user,
+        errors_flag_by_user,
+        unique_user_ids,
+    ) = validate_rows(header, chain(head, rows))
+    warnings = format_warnings(issues, suppressed_count)
+    stats = compute_summary_statistics(unique_user_ids, sessions_per_user, errors_flag_by_user)
+    sample_rows = [dict(zip(header, row)) for row in head]
+    total_warnings = len(issues) + suppressed_count
+    return warnings, total_warnings, stats, sample_rows
 
 
-def analyze_csv_content(csv_text: str) -> AnalysisResponse:
+async def analyze_csv_content(csv_stream: TextIO) -> AnalysisResponse:
     """Perform the full validation and summary workflow on provided CSV data."""
-    rows = parse_csv_rows(csv_text)
-    warnings, sessions_per_user, errors_flag_by_user, unique_user_ids = validate_rows(rows)
-    stats = compute_summary_statistics(unique_user_ids, sessions_per_user, errors_flag_by_user)
-    ai_summary, ai_notice = generate_openai_summary(warnings, stats, rows)
+    # Parsing and validation are CPU-bound, so run them on a worker thread to
+    # keep the event loop free for other requests.
+    warnings, total_warnings, stats, sample_rows = await asyncio.to_thread(
+        inspect_csv_content, csv_stream
+    )
+    ai_summary, ai_notice = await generate_openai_summary(
+        warnings, total_warnings, stats, sample_rows
+    )
 
     return AnalysisResponse(
         warnings=warnings,
@@ -274,26 +598,81 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+class UploadReader(io.RawIOBase):
+    """Readable raw-stream view over an upload's spooled file.
+
+    Before Python 3.11, ``tempfile.SpooledTemporaryFile`` is not an ``IOBase``
+    and lacks ``readable()``, so ``io.TextIOWrapper`` cannot wrap it directly.
+    Closing this reader leaves the underlying file open.
+    """
+
+    def __init__(self, fileobj) -> None:
+        super().__init__()
+        self._fileobj = fileobj
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._fileobj.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def is_gzip_upload(file: UploadFile) -> bool:
+    """Return True when an upload is a gzip-compressed CSV."""
+    content_encoding = (file.headers.get("content-encoding") or "").lower()
+    return (
+        file.content_type in GZIP_CONTENT_TYPES
+        or content_encoding == "gzip"
+        or (file.filename or "").lower().endswith(".gz")
+    )
+
+
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze_dataset(file: UploadFile = File(...)) -> AnalysisResponse:
-    """Accept a CSV upload, validate it, and return the analysis results."""
-    if file.content_type not in {"text/csv", "application/vnd.ms-excel"}:
+    """Accept a CSV upload, validate it, and return the analysis results.
+
+    Gzip-compressed CSV files are decompressed on the fly while parsing.
+    """
+    compressed = is_gzip_upload(file)
+    if not compressed and file.content_type not in CSV_CONTENT_TYPES:
         raise HTTPException(status_code=400, detail="Please upload a CSV file.")
 
-    content_bytes = await file.read()
-    if not content_bytes:
+    source = gzip.GzipFile(fileobj=file.file, mode="rb") if compressed else file.file
+
+    # Peek at the spooled upload instead of reading it into memory; it is
+    # decompressed and decoded incrementally while the CSV is parsed.
+    try:
+        is_empty = not source.read(1)
+        source.seek(0)
+    except (OSError, EOFError, zlib.error) as exc:
+        if not compressed:
+            raise
+        raise HTTPException(status_code=400, detail=f"Unable to decompress gzip file: {exc}") from exc
+    if is_empty:
         raise HTTPException(
             status_code=400,
             detail="The input file is empty. Please upload a valid dataset.",
         )
 
+    if not isinstance(source, io.IOBase):
+        source = UploadReader(source)
+
+    # Accept UTF-8 with or without BOM.
+    csv_stream = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
     try:
-        # Accept UTF-8 with or without BOM; fallback to latin-1 to avoid decode errors.
-        csv_text = content_bytes.decode("utf-8-sig")
+        return await analyze_csv_content(csv_stream)
     except UnicodeDecodeError as exc:
         raise HTTPException(status_code=400, detail=f"Unable to decode file as UTF-8: {exc}") from exc
-
-    try:
-        return analyze_csv_content(csv_text)
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
+    except (OSError, EOFError, zlib.error) as exc:
+        if not compressed:
+            raise
+        raise HTTPException(status_code=400, detail=f"Unable to decompress gzip file: {exc}") from exc
+    finally:
+        # Leave the underlying file for UploadFile to close.
+        csv_stream.detach()
+        if compressed:
+            source.close()
@@ -63,7 +63,7 @@ export default function App() {
         <form className="upload-form" onSubmit={handleSubmit}>
           <label className="file-input">
             <span>Select CSV file</span>
-            <input type="file" accept=".csv,text/csv" onChange={handleFileChange} />
+            <input type="file" accept=".csv,.csv.gz,text/csv,application/gzip" onChange={handleFileChange} />
           </label>
           <button type="submit" disabled={loading}>
             {loading ? "Analyzing..." : "Analyze Dataset"}
@@ -107,11 +107,10 @@ export default function App() {
           )}
 
           <h2>Support Ticket Summary</h2>
-          {result.ai_summary ? (
+          {result.ai_summary && (
             <article className="ai-summary">{result.ai_summary}</article>
-          ) : (
-            <p className="notice">{result.ai_notice}</p>
           )}
+          {result.ai_notice && <p className="notice">{result.ai_notice}</p>}
         </section>
       )}
     </main>
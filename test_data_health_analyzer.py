@@ -0,0 +1,53 @@
+"""Tests for the /analyze endpoint of the data health analyzer service."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from data_health_analyzer import app
+
+SAMPLE_CSV = Path(__file__).with_name("sample_user_metrics.csv")
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return TestClient(app)
+
+
+def test_analyze_plain_csv_upload(client: TestClient) -> None:
+    response = client.post(
+        "/analyze",
+        files={"file": ("sample_user_metrics.csv", SAMPLE_CSV.read_bytes(), "text/csv")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["warnings"] == [
+        "Row 5: missing value in sessions column.",
+        "Row 6: negative value in clicks column.",
+        "Row 7: duplicate user_id U101 detected.",
+    ]
+    assert body["statistics"] == {
+        "total_users": 5,
+        "average_sessions_per_user": 5.25,
+        "percent_users_with_errors": 60.0,
+    }
+    assert body["ai_summary"] is None
+
+
+def test_analyze_reports_unparseable_integers_as_warnings(client: TestClient) -> None:
+    too_long = "9" * 5000
+    csv_bytes = (
+        "user_id,sessions,clicks,errors\n"
+        f"U1,{too_long},3,0\n"
+        "U2,-0,-00,-0\n"
+    ).encode()
+
+    response = client.post("/analyze", files={"file": ("big.csv", csv_bytes, "text/csv")})
+
+    assert response.status_code == 200
+    assert response.json()["warnings"] == [
+        f"Row 2: invalid integer value '{too_long}' in sessions column.",
+    ]